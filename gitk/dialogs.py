@@ -731,6 +731,8 @@ class SearchDialogPopup(UserInputDialogPopup):
             ]
         )
         buttons.is_selectable = False
+        self._matcher_key = None
+        self._matcher = None
         super().__init__(app, id, " Search", self.header, buttons, width=width)
 
     def clear_input(self):
@@ -745,25 +747,59 @@ class SearchDialogPopup(UserInputDialogPopup):
         self.dirty = True
         super().execute()
 
-    def matches(self, item):
-        if not self.input.txt:
-            return False
-        text = item.get_text()
-        if self.use_regexp.toggled:
-            # matches() runs on every redraw (to highlight hits) and on each
-            # keystroke, so a half-typed / invalid pattern (e.g. "[", "(") must
-            # not raise: an invalid regex simply matches nothing until valid.
+    def text_matcher(self):
+        """Return a text -> match predicate for the current query.
+
+        matches() runs for every visible row on every redraw (to highlight
+        hits), so the compiled pattern is derived once and reused until the
+        query text or the Case/Regexp flags change, not rebuilt per row. The
+        same object is returned until then, so callers may key caches on it."""
+        key = self.query_key()
+        if key != self._matcher_key:
+            self._matcher_key = key
+            self._matcher = self._build_matcher(*key)
+        return self._matcher
+
+    def query_key(self):
+        """(text, case sensitive, regexp) of the current query: what
+        text_matcher() is built from."""
+        return (self.input.txt, self.case_sensitive.toggled, self.use_regexp.toggled)
+
+    @staticmethod
+    def narrows(old_key, new_key) -> bool:
+        """Whether query `new_key` can only match texts that `old_key` matched:
+        both plain substring queries with the same Case setting, the new text
+        containing the old (typically the old one typed further). Callers can
+        then filter their earlier hits instead of rescanning."""
+        old_txt, old_case, old_regexp = old_key
+        new_txt, new_case, new_regexp = new_key
+        return (
+            bool(old_txt)
+            and not old_regexp
+            and not new_regexp
+            and old_case == new_case
+            and old_txt in new_txt
+        )
+
+    @staticmethod
+    def _build_matcher(txt, case_sensitive, use_regexp):
+        if not txt:
+            return lambda text: False
+        if use_regexp:
+            # A half-typed / invalid pattern (e.g. "[", "(") must not raise: an
+            # invalid regex simply matches nothing until it becomes valid.
             try:
-                return re.search(
-                    self.input.txt,
-                    text,
-                    0 if self.case_sensitive.toggled else re.IGNORECASE,
-                )
+                return re.compile(txt, 0 if case_sensitive else re.IGNORECASE).search
             except re.error:
-                return None
-        if self.case_sensitive.toggled:
-            return self.input.txt in text
-        return self.input.txt.lower() in text.lower()
+                return lambda text: None
+        if case_sensitive:
+            return lambda text: txt in text
+        # Case-insensitive substring: an escaped IGNORECASE pattern matches in
+        # the C regex engine without lower()-copying every row it tests.
+        return re.compile(re.escape(txt), re.IGNORECASE).search
+
+    def matches(self, item):
+        return self.text_matcher()(item.get_text())
 
     def handle_input(self, keyboard):
         key = keyboard.key
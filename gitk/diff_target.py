@@ -4,7 +4,8 @@ The diff pane can show a commit, a two-revision range, an uncommitted
 worktree/index diff, or an annotated tag body. Each is a frozen dataclass
 owning its own git invocation, header title, view-identity key (used to
 detect "already showing this"), whether scroll position is tracked across
-revisits, and the blame base revision for jump-to-origin. Pure: no curses/app
+revisits, whether its output can be cached (it names only immutable objects),
+and the blame base revision for jump-to-origin. Pure: no curses/app
 imports, so it is unit-testable and safe to import from anywhere.
 """
 
@@ -49,6 +50,7 @@ class CommitTarget:
 
     commit_id: str
     tracks_position: typing.ClassVar[bool] = True
+    cacheable: typing.ClassVar[bool] = True
 
     @property
     def view_key(self) -> str:
@@ -77,6 +79,11 @@ class RangeTarget:
     def view_key(self) -> str:
         return self.old_commit_id
 
+    @property
+    def cacheable(self) -> bool:
+        # Without a new side the diff runs against the (mutable) working tree.
+        return bool(self.new_commit_id)
+
     def title(self) -> str:
         return f"Diff {self.old_commit_id[:7]} {self.new_commit_id[:7]}"
 
@@ -103,6 +110,7 @@ class WorktreeTarget:
 
     staged: bool
     tracks_position: typing.ClassVar[bool] = True
+    cacheable: typing.ClassVar[bool] = False
 
     @property
     def view_key(self) -> str:
@@ -130,6 +138,7 @@ class TagTarget:
 
     tag_id: str
     tracks_position: typing.ClassVar[bool] = False
+    cacheable: typing.ClassVar[bool] = True
 
     @property
     def view_key(self) -> str:
@@ -26,6 +26,13 @@ from gitk.segments import ref_color_and_title
 
 
 class Item:
+    # The bulk row types declare __slots__: log commit rows (CommitListItem
+    # and its SegmentedListItem base) and the text/diff/stat rows below. A big
+    # log or diff is tens of thousands of these, and a per-instance __dict__
+    # would roughly double each row's footprint. Subclasses that don't declare
+    # slots (ref, menu, dialog and pseudo rows) keep a __dict__ as before.
+    __slots__ = ("_view", "is_selectable", "is_separator")
+
     def __init__(self):
         self.is_selectable = True
         self.is_separator = False
@@ -51,6 +58,13 @@ class Item:
     def draw_line(self, win, offset, width, selected, matched, marked):
         pass
 
+    def render_key(self) -> typing.Any:
+        """A value that changes whenever this row would draw differently (other
+        than its selected/matched flags and the view's geometry), or None if it
+        must be redrawn every frame. ListView.draw skips a row whose key equals
+        the one it drew at the same screen row last frame."""
+        return None
+
     def activate(self) -> bool:
         """Default action on Enter / double-click. Override in subclasses."""
         return False
@@ -76,6 +90,8 @@ class SeparatorItem(Item):
 
 
 class TextListItem(Item):
+    __slots__ = ("_clip", "_clip_key", "color", "dim", "expand", "txt")
+
     def __init__(
         self, txt, color=Screen.C_NORMAL, expand=False, is_selectable=True, dim=False
     ):
@@ -85,6 +101,10 @@ class TextListItem(Item):
         self.expand = expand
         self.is_selectable = is_selectable
         self.dim = dim
+        # The last clipped line drawn and what it was clipped for; a redraw at
+        # the same scroll column and width (the common case) reuses it.
+        self._clip_key = None
+        self._clip = None
 
     def get_text(self):
         return self.txt
@@ -92,20 +112,39 @@ class TextListItem(Item):
     def set_text(self, txt: str):
         self.txt = txt
 
-    def draw_line(self, win, offset, width, selected, matched, marked):
-        line = self.get_text()[offset:]
-        clear = True
-        if selected or marked or self.expand:
-            line += " " * (width - len(line))
-            clear = False
+    def render_key(self):
+        return (self.get_text(), self.color, self.dim, self.expand)
+
+    @staticmethod
+    def _clip_line(text, offset, width, pad):
+        """The part of `text` visible from column `offset` in `width` columns,
+        and how to finish the row: the number of blank columns to fill in the
+        row's colour when `pad`, else -1 if the rest of the row needs clearing."""
+        # Slice only the visible columns: a long line (minified JS/JSON) is not
+        # copied whole just to be cut down to the window width.
+        line = text[offset : offset + width]
         if len(line) >= width:
-            line = line[:width]
-            clear = False
+            return line, 0
+        if pad:
+            return line, width - len(line)
+        return line, -1
 
-        win.addstr(
-            line, Screen.color(self.color, selected, marked, matched, dim=self.dim)
-        )
-        if clear:
+    def draw_line(self, win, offset, width, selected, matched, marked):
+        text = self.get_text()
+        pad = bool(selected or marked or self.expand)
+        key = (text, offset, width, pad)
+        if key != self._clip_key:
+            self._clip_key = key
+            self._clip = self._clip_line(text, offset, width, pad)
+        line, fill = self._clip
+
+        attr = Screen.color(self.color, selected, marked, matched, dim=self.dim)
+        win.addstr(line, attr)
+        if fill > 0:
+            # Band the rest of the row in the row's colour with one curses call
+            # instead of building (and caching) a space-padded copy of the line.
+            win.hline(ord(" ") | attr, fill)
+        elif fill < 0:
             win.clrtoeol()
 
 
@@ -117,6 +156,10 @@ class RefListItem(TextListItem):
     def get_text(self):
         return self.data["name"]
 
+    def render_key(self):
+        # The colour is picked at draw time from the current HEAD branch.
+        return (super().render_key(), self.get_app().git_log.head_branch)
+
     def draw_line(self, win, offset, width, selected, matched, marked):
         self.color, _ = ref_color_and_title(
             self.data, self.get_app().git_log.head_branch
@@ -142,6 +185,8 @@ class SpacerListItem(Item):
 
 
 class StatListItem(TextListItem):
+    __slots__ = ("stat_file_path",)
+
     def __init__(self, txt: str, color: int, stat_file_path: str):
         self.stat_file_path = stat_file_path
         super().__init__(txt, color)
@@ -149,6 +194,13 @@ class StatListItem(TextListItem):
     def jump_to_file(self):
         diff = self.get_app().git_diff
         diff.add_jump_point()
+        row = diff.file_header_row(self.stat_file_path)
+        if row is not None:
+            diff.set_selected(row, "top")
+            diff.add_jump_point()
+            return
+        # No indexed header (a quoted path, or a rename whose header holds more
+        # than one " b/"): scan for it.
         # Escape the path: filenames can legally contain regex metacharacters
         # ('[', '(', '+', '.', ...); without re.escape a name like "test[1].txt"
         # makes re.compile raise (crash) and benign metachars mis-match the line.
@@ -160,7 +212,26 @@ class StatListItem(TextListItem):
         return True
 
 
+class FileHeaderListItem(TextListItem):
+    """A diff's "diff --git a/... b/..." line, carrying the (post-rename) b/
+    path it introduces, parsed once when the line is read."""
+
+    __slots__ = ("file_path",)
+
+    def __init__(self, txt: str, color: int, file_path: str):
+        self.file_path = file_path
+        super().__init__(txt, color)
+
+
 class DiffListItem(TextListItem):
+    __slots__ = (
+        "line",
+        "new_file_line",
+        "new_file_path",
+        "old_file_line",
+        "old_file_path",
+    )
+
     def __init__(
         self,
         line: int,
@@ -179,39 +250,13 @@ class DiffListItem(TextListItem):
         super().__init__(txt, color)
 
     def jump_to_origin(self):
-        from gitk.jobs import (
-            Job,
-        )  # late import: jobs imports items, so avoid a load-time cycle
-
         app = self.get_app()
-        blame_revision = app.git_diff.blame_revision()
-        if not (self.old_file_path and self.old_file_line and blame_revision):
+        if not (self.old_file_path and self.old_file_line):
             return
-
-        args = [
-            "git",
-            "blame",
-            "-lsfn",
-            "-L",
-            f"{self.old_file_line},{self.old_file_line}",
-            blame_revision,
-            "--",
-            self.old_file_path,
-        ]
-        result = Job.run_job(app, args)
-        if result.returncode != 0:
-            return
-
-        # e.g. "a42cadebfe42d85cbf36f4887be166b34077b3e2 test test.txt 1 1) aaa"
-        match = re.search(r"^(\S+) ([^)]+) ([0-9]+) ", result.stdout)
-        if not match:
+        origin = app.git_diff.line_origin(self.old_file_path, self.old_file_line)
+        if origin is None:
             return
-        id, file_path, file_line = match.group(1), match.group(2), int(match.group(3))
-
-        # A '^' prefix marks git blame's boundary (initial) commit; its id is one
-        # char short, so resolve it back to a full sha.
-        if id.startswith("^"):
-            id = Job.run_job(app, ["git", "rev-parse", id]).stdout.lstrip("^").rstrip()
+        id, file_path, file_line = origin
 
         commit = app.git_log.select_commit(id)
         if not commit:
@@ -287,56 +332,70 @@ class UserInputListItem(Item):
             pos += 1
         return pos
 
-    def handle_input(self, keyboard):
-        key = keyboard.key
-        if key in (curses.KEY_BACKSPACE, 127):  # Backspace
-            if self.cursor_pos > 0:
-                self.txt = self.txt[: self.cursor_pos - 1] + self.txt[self.cursor_pos :]
-                self.cursor_pos -= 1
+    def _backspace(self):
+        if self.cursor_pos > 0:
+            self.txt = self.txt[: self.cursor_pos - 1] + self.txt[self.cursor_pos :]
+            self.cursor_pos -= 1
 
-        elif key == KEY_CTRL_BACKSPACE:  # Ctrl+Backspace: delete previous word
-            start = self.prev_word_pos()
-            self.txt = self.txt[:start] + self.txt[self.cursor_pos :]
-            self.cursor_pos = start
+    def _delete_prev_word(self):
+        start = self.prev_word_pos()
+        self.txt = self.txt[:start] + self.txt[self.cursor_pos :]
+        self.cursor_pos = start
 
-        elif key == curses.KEY_DC:  # Delete key
-            if self.cursor_pos < len(self.txt):
-                self.txt = self.txt[: self.cursor_pos] + self.txt[self.cursor_pos + 1 :]
+    def _delete(self):
+        if self.cursor_pos < len(self.txt):
+            self.txt = self.txt[: self.cursor_pos] + self.txt[self.cursor_pos + 1 :]
 
-        elif key == KEY_CTRL_DEL:  # Ctrl+Delete: clear whole text
-            self.txt = ""
-            self.cursor_pos = 0
-            self.offset = 0
+    def _cursor_left(self):
+        if self.cursor_pos > 0:
+            self.cursor_pos -= 1
 
-        elif key == curses.KEY_LEFT:  # Left arrow
-            if self.cursor_pos > 0:
-                self.cursor_pos -= 1
-
-        elif key == curses.KEY_RIGHT:  # Right arrow
-            if self.cursor_pos < len(self.txt):
-                self.cursor_pos += 1
+    def _cursor_right(self):
+        if self.cursor_pos < len(self.txt):
+            self.cursor_pos += 1
 
-        elif key == KEY_CTRL_LEFT:  # Ctrl+Left: previous word
-            self.cursor_pos = self.prev_word_pos()
+    def _word_left(self):
+        self.cursor_pos = self.prev_word_pos()
 
-        elif key == KEY_CTRL_RIGHT:  # Ctrl+Right: next word
-            self.cursor_pos = self.next_word_pos()
+    def _word_right(self):
+        self.cursor_pos = self.next_word_pos()
 
-        elif key == curses.KEY_HOME:  # Home key
-            self.cursor_pos = 0
+    def _home(self):
+        self.cursor_pos = 0
 
-        elif key == curses.KEY_END:  # End key
-            self.cursor_pos = len(self.txt)
+    def _end(self):
+        self.cursor_pos = len(self.txt)
+
+    # Editing keys -> handler, looked up once per keystroke instead of walking
+    # an if/elif ladder (printable characters, the common case, used to be
+    # tested last). Ctrl+Delete clears the whole text, like clear().
+    _EDIT_KEYS: typing.ClassVar[dict[int, typing.Callable]] = {
+        curses.KEY_BACKSPACE: _backspace,
+        127: _backspace,
+        KEY_CTRL_BACKSPACE: _delete_prev_word,
+        curses.KEY_DC: _delete,
+        KEY_CTRL_DEL: clear,
+        curses.KEY_LEFT: _cursor_left,
+        curses.KEY_RIGHT: _cursor_right,
+        KEY_CTRL_LEFT: _word_left,
+        KEY_CTRL_RIGHT: _word_right,
+        curses.KEY_HOME: _home,
+        curses.KEY_END: _end,
+    }
 
-        elif 32 <= key <= 126:  # Printable characters
+    def handle_input(self, keyboard):
+        key = keyboard.key
+        if 32 <= key <= 126:  # Printable characters
             self.txt = (
                 self.txt[: self.cursor_pos] + chr(key) + self.txt[self.cursor_pos :]
             )
             self.cursor_pos += 1
+            return True
 
-        else:
+        action = self._EDIT_KEYS.get(key)
+        if action is None:
             return super().handle_input(keyboard)
-
+        action(self)
         return True
 
     def handle_mouse_input(self, mouse) -> bool:
@@ -361,10 +420,12 @@ class UserInputListItem(Item):
         right_txt = self.txt[self.cursor_pos : self.offset + field]
         pad = max(0, width - len(left_txt) - len(right_txt) - 1)
 
-        win.addstr(left_txt, Screen.color(self.color, selected, marked, matched))
+        attr = Screen.color(self.color, selected, marked, matched)
+        win.addstr(left_txt, attr)
         win.addch(ord(" "), curses.A_REVERSE | curses.A_BLINK)
-        win.addstr(right_txt, Screen.color(self.color, selected, marked, matched))
-        win.addstr(" " * pad, Screen.color(self.color, selected, marked, matched))
+        win.addstr(right_txt, attr)
+        if pad:
+            win.hline(ord(" ") | attr, pad)
 
 
 class ResetModeItem(TextListItem):
@@ -378,6 +439,9 @@ class ResetModeItem(TextListItem):
         self.get_app().git_log.reset(self.mode, self.dialog.commit_id)
         return True
 
+    def render_key(self):
+        return (super().render_key(), self.dialog.selected_mode == self.mode)
+
     def draw_line(self, win, offset, width, selected, matched, marked):
         # Keep the chosen mode highlighted even when focus moves to the buttons
         # (ListView.draw always passes marked=False, so we can't use that flag).
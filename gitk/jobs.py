@@ -18,7 +18,13 @@ import threading
 import typing
 
 from gitk.ids import ID_GIT_DIFF, ID_GIT_REFRESH_HEAD, ID_GIT_REFS, ID_GIT_SEARCH
-from gitk.items import DiffListItem, RefListItem, StatListItem, TextListItem
+from gitk.items import (
+    DiffListItem,
+    FileHeaderListItem,
+    RefListItem,
+    StatListItem,
+    TextListItem,
+)
 from gitk.screen import Screen
 from gitk.segmented_items import CommitListItem
 
@@ -30,6 +36,12 @@ from gitk.segmented_items import CommitListItem
 # caret-notation clutter), not a terminal-injection guard.
 _CONTROL_CHARS = re.compile(r"[\x00-\x08\x0b-\x1f\x7f-\x9f]")
 
+# Most rows a job hands to its view per main-loop tick. A big diff or log
+# streams in faster than it can be appended, so draining the whole backlog in
+# one tick would hold back the first paint; capping it lets the first screen
+# draw after one batch while the rest follows on later ticks.
+JOB_BATCH_SIZE = 2000
+
 
 def _git_env():
     """Pin LC_ALL=C so git speaks English: callers parse stdout/stderr to
@@ -55,7 +67,7 @@ class Job:
     def process_all_jobs(cls) -> bool:
         update = False
         for job in cls.jobs.values():
-            processed = job.process_items()
+            processed = job.process_items(JOB_BATCH_SIZE)
             if processed or job.running:
                 update = True
         return update
@@ -96,12 +108,15 @@ class Job:
                 self.on_finished()
                 self.on_finished = None
 
-    def _drain(self, q, handler) -> bool:
+    def _drain(self, q, handler, limit=None) -> bool:
         """Drain a queue, dispatching each truthy item to handler (skipped while
-        stopped). Returns True if anything was processed."""
+        stopped); at most `limit` items if given. Returns True if anything was
+        processed."""
         processed = False
         try:
-            while True:
+            while limit is None or limit > 0:
+                if limit is not None:
+                    limit -= 1
                 item = q.get_nowait()
                 q.task_done()
                 if not item:
@@ -113,8 +128,15 @@ class Job:
             pass
         return processed
 
-    def process_items(self) -> bool:
-        drained_items = self._drain(self.items, self.process_item)
+    def process_items(self, limit=None) -> bool:
+        """Hand queued rows (up to `limit`) and then all queued messages to
+        the view. Returns True if anything was processed."""
+        drained_items = self._drain(self.items, self.process_item, limit)
+        if limit is not None and not self.items.empty():
+            # Rows are still backed up: hold the messages until they are
+            # through, so 'finished' (and its on_finished) still runs after
+            # the last row, as it did when every tick drained everything.
+            return drained_items
         drained_msgs = self._drain(self.messages, self.process_message)
         return drained_items or drained_msgs
 
@@ -187,15 +209,17 @@ class Job:
     def _reader_thread(self, stream, is_stderr=False):
         if not is_stderr:
             self.messages.put({"type": "started"})
+        # curses automatically converts tab to spaces, so we will replace it here
+        # and cut off newline. The tab width doesn't change mid-run: look it up
+        # once, not per line.
+        tab = " " * (curses.get_tabsize() if hasattr(curses, "get_tabsize") else 8)
         for bytearr in iter(stream.readline, b""):
             if self.stop:
                 break
             try:
-                # curses automatically converts tab to spaces, so we will replace it here and cut off newline
-                tabsize = curses.get_tabsize() if hasattr(curses, "get_tabsize") else 8
                 line = (
                     bytearr.decode("utf-8", errors="replace")
-                    .replace("\t", " " * tabsize)
+                    .replace("\t", tab)
                     .rstrip("\r\n")
                 )
                 # Strip C0/C1 control chars from streamed git text for a clean
@@ -317,9 +341,9 @@ class GitDiffJob(Job):
         super().__init__(app, ID_GIT_DIFF)
         self.cmd = "git"
 
-        self.line_pattern = re.compile(
-            r"^(?:( )|(?:\+\+\+ b/(.*))|(?:--- a/(.*))|(\+\+\+|---|diff|index)|(\+)|(-)|(@@ -(\d+),\d+ \+(\d+),\d+ @@))"
-        )
+        # A hunk header ("@@ -old,count +new,count @@"); the line numbers seed
+        # the per-row old/new line tracking.
+        self.hunk_pattern = re.compile(r"@@ -(\d+),\d+ \+(\d+),\d+ @@")
         # Detects a diffstat line (" path | 5 +-"); the post-rename path used for
         # jump-to-file is reconstructed separately by _stat_file_path.
         self.stat_pattern = re.compile(r" (?:\.\.\.)?(?:.* => )?(.*?)}? +\| +\d+ \+*-*")
@@ -356,68 +380,95 @@ class GitDiffJob(Job):
             path = path.rsplit(" => ", 1)[-1]  # a => b -> b
         return path
 
+    @staticmethod
+    def _file_header_path(line):
+        """The (post-rename) b/ path a "diff --git a/<old> b/<new>" header
+        introduces, or None if it can't be told for sure.
+
+        A name may itself contain " b/", so the header is only split where that
+        is unambiguous: equal a/ and b/ halves, or a single " b/" in the line.
+        Other headers (and quoted paths) stay plain rows, which jump-to-file
+        finds by scanning instead."""
+        if not line.startswith("diff --git a/"):
+            return None
+        rest = line[13:]  # "<old> b/<new>"
+        n, odd = divmod(len(rest) - 3, 2)
+        if n > 0 and not odd and rest[n : n + 3] == " b/" and rest[:n] == rest[n + 3 :]:
+            return rest[:n]
+        if rest.count(" b/") == 1:
+            return rest.split(" b/", 1)[1]
+        return None
+
     def process_line(self, line) -> typing.Any:
         color = Screen.C_NORMAL
         self.line_count += 1
 
-        # 9 capture groups
-        match = self.line_pattern.search(line)
-        if match:
-            if match.group(1):  # code lines, stats and commit message
-                if (
-                    self.old_file_line < 0 and self.new_file_line < 0
-                ):  # commit message or stats line
-                    # Diffstat lines are indented with a single space
-                    # (" file | 5 ++"); commit-message body lines with four. Only
-                    # parse a stat on the former, so a message line that happens to
-                    # contain "| N +-" (e.g. a markdown table) is not misread as a
-                    # clickable stat row pointing at a bogus file.
-                    if line.startswith(" ") and not line.startswith(
-                        "    "
-                    ):  # stats line
-                        color = Screen.C_DIFF_RANGE
-                        if self.stat_pattern.match(line):
-                            return StatListItem(line, color, self._stat_file_path(line))
-                    return TextListItem(line, color)
-                self.old_file_line += 1
-                self.new_file_line += 1
-                old_path, old_line = self.old_file_path, self.old_file_line
-                new_path, new_line = self.new_file_path, self.new_file_line
-            elif match.group(2):  # '+++' new file
-                color = Screen.C_DIFF_INFO
-                self.new_file_path = str(match.group(2))
-                return TextListItem(line, color)
-            elif match.group(3):  # '---' old file
-                color = Screen.C_DIFF_INFO
-                self.old_file_path = str(match.group(3))
+        # Dispatch on the first character: one compare per line instead of a
+        # nine-group regex, with the longer "+++"/"---" prefixes tried before
+        # the bare '+'/'-' they start with.
+        first = line[:1]
+        if first == " ":  # code lines, stats and commit message
+            if (
+                self.old_file_line < 0 and self.new_file_line < 0
+            ):  # commit message or stats line
+                # Diffstat lines are indented with a single space
+                # (" file | 5 ++"); commit-message body lines with four. Only
+                # parse a stat on the former, so a message line that happens to
+                # contain "| N +-" (e.g. a markdown table) is not misread as a
+                # clickable stat row pointing at a bogus file.
+                if not line.startswith("    "):  # stats line
+                    color = Screen.C_DIFF_RANGE
+                    if self.stat_pattern.match(line):
+                        return StatListItem(line, color, self._stat_file_path(line))
                 return TextListItem(line, color)
-            elif match.group(4):  # infos
-                color = Screen.C_DIFF_INFO
+            self.old_file_line += 1
+            self.new_file_line += 1
+            old_path, old_line = self.old_file_path, self.old_file_line
+            new_path, new_line = self.new_file_path, self.new_file_line
+        elif first == "+":
+            if line.startswith("+++"):
+                if line.startswith("+++ b/"):  # '+++' new file
+                    if len(line) == 6:  # no path: plain text
+                        return TextListItem(line, color)
+                    self.new_file_path = line[6:]
+                return TextListItem(line, Screen.C_DIFF_INFO)
+            # '+' added code lines
+            color = Screen.C_DIFF_ADD
+            self.new_file_line += 1
+            old_path, old_line = None, None
+            new_path, new_line = self.new_file_path, self.new_file_line
+        elif first == "-":
+            if line.startswith("---"):
+                if line.startswith("--- a/"):  # '---' old file
+                    if len(line) == 6:  # no path: plain text
+                        return TextListItem(line, color)
+                    self.old_file_path = line[6:]
+                return TextListItem(line, Screen.C_DIFF_INFO)
+            # '-' remove code lines
+            color = Screen.C_DIFF_DEL
+            self.old_file_line += 1
+            old_path, old_line = self.old_file_path, self.old_file_line
+            new_path, new_line = None, None
+        elif first == "@":  # diff numbers
+            match = self.hunk_pattern.match(line)
+            if not match:
                 return TextListItem(line, color)
-            elif match.group(5):  # '+' added code lines
-                color = Screen.C_DIFF_ADD
-                self.new_file_line += 1
-                old_path, old_line = None, None
-                new_path, new_line = self.new_file_path, self.new_file_line
-            elif match.group(6):  # '-' remove code lines
-                color = Screen.C_DIFF_DEL
-                self.old_file_line += 1
-                old_path, old_line = self.old_file_path, self.old_file_line
-                new_path, new_line = None, None
-            elif match.group(7):  # diff numbers
-                color = Screen.C_DIFF_RANGE
-                self.old_file_line = int(match.group(8)) - 1
-                self.new_file_line = int(match.group(9)) - 1
-                old_path, old_line = self.old_file_path, self.old_file_line
-                new_path, new_line = self.new_file_path, self.new_file_line
-            else:
-                return TextListItem(line, color)
-
-            return DiffListItem(
-                self.line_count, line, color, old_path, old_line, new_path, new_line
-            )
+            color = Screen.C_DIFF_RANGE
+            self.old_file_line = int(match.group(1)) - 1
+            self.new_file_line = int(match.group(2)) - 1
+            old_path, old_line = self.old_file_path, self.old_file_line
+            new_path, new_line = self.new_file_path, self.new_file_line
+        elif line.startswith(("diff", "index")):  # infos
+            path = self._file_header_path(line)
+            if path is not None:  # file header
+                return FileHeaderListItem(line, Screen.C_DIFF_INFO, path)
+            return TextListItem(line, Screen.C_DIFF_INFO)
+        else:
+            return TextListItem(line, color)
 
-        return TextListItem(line, color)
+        return DiffListItem(
+            self.line_count, line, color, old_path, old_line, new_path, new_line
+        )
 
     def process_item(self, item):
         self.app.git_diff.append(item)
@@ -451,6 +502,7 @@ class GitRefsJob(Job):
 
     def start_job(self, args=[], on_finished=None):
         self.app.git_refs.refs.clear()
+        self.app.git_refs.refs_version += 1
 
         self.app.git_log.head_branch = Job.run_job(
             self.app, ["git", "rev-parse", "--abbrev-ref", "HEAD"]
@@ -484,6 +536,7 @@ class GitRefsJob(Job):
             self.app.git_refs.append(RefListItem(item))
 
         self.app.git_refs.refs.setdefault(id, []).append(item)
+        self.app.git_refs.refs_version += 1
         self.app.git_log.dirty = True
         if item["type"] == "head":
             self.app.git_log.head_id = id
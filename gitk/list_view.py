@@ -38,6 +38,11 @@ class ListView(View):
         self._offset_x: int = 0
         self.autoscroll: bool = False
         self._search_dialog: typing.Optional[SearchDialogPopup] = None
+        # What draw() last put on each body row (see Item.render_key), and the
+        # frame-wide inputs it was drawn with. A row whose key is unchanged is
+        # still in the window buffer, so it is not redrawn.
+        self._drawn_rows = []
+        self._drawn_frame = None
 
     def set_search_dialog(self, search_dialog: "SearchDialogPopup"):
         self._search_dialog = search_dialog
@@ -95,11 +100,12 @@ class ListView(View):
         """Add item to end of list"""
         item._view = self
         self.items.append(item)
+        count = len(self.items)
         # The new row is at index len-1, i.e. screen row (len-1) - offset_y, so
         # it is on-screen when (len - offset_y) <= height. The bound must be '<=',
         # not '<': a row landing exactly on the last visible line would otherwise
         # count as off-screen, leaving the bottom row blank until a later redraw.
-        if len(self.items) - self._offset_y <= self.height:
+        if count - self._offset_y <= self.height:
             self.dirty = True
         else:
             # The new row is off-screen, so the body need not be redrawn — but
@@ -111,7 +117,7 @@ class ListView(View):
             # the body must be redrawn — but the on-screen check above ran against
             # the OLD offset and would only have set header_dirty, leaving the
             # autoscrolled body stale. Mark dirty whenever the offset moves.
-            new_offset = max(0, len(self.items) - self.height)
+            new_offset = max(0, count - self.height)
             if new_offset != self._offset_y:
                 self._offset_y = new_offset
                 self.dirty = True
@@ -132,9 +138,11 @@ class ListView(View):
 
     def set_selected(self, what: int | str | re.Pattern, visible_mode="center") -> bool:
         new_index = None
+        # Read once: the fallback search below can walk many rows.
+        count = len(self.items)
 
         if isinstance(what, int):
-            if (0 <= what < len(self.items)) or (what <= 0 and not self.items):
+            if (0 <= what < count) or (what <= 0 and not self.items):
                 new_index = what
         elif isinstance(what, (str, re.Pattern)):
             test = (
@@ -156,14 +164,11 @@ class ListView(View):
                 # match. Each pass stops at the current selection (never crosses
                 # it). If neither finds one, leave selection unchanged.
                 direction = 1 if new_index > self._selected else -1
-                if (
-                    0 <= new_index < len(self.items)
-                    and not self.items[new_index].is_selectable
-                ):
+                if 0 <= new_index < count and not self.items[new_index].is_selectable:
                     target = new_index
                     for step in [direction, -direction]:
                         i = target + step
-                        while 0 <= i < len(self.items) and i != self._selected:
+                        while 0 <= i < count and i != self._selected:
                             if self.items[i].is_selectable:
                                 new_index = i
                                 break
@@ -185,7 +190,7 @@ class ListView(View):
                         0,
                         min(
                             self._selected - int(self.height / 2),
-                            len(self.items) - self.height,
+                            count - self.height,
                         ),
                     )
                 elif visible_mode == "top":
@@ -222,9 +227,11 @@ class ListView(View):
             if repeat:
                 ranges.append(range(len(self.items) - 1, self._selected - 1, -1))
 
+        matches = self._search_dialog.matches
+        items = self.items
         for search_range in ranges:
             for i in search_range:
-                if self._search_dialog.matches(self.items[i]):
+                if matches(items[i]):
                     self.set_selected(i)
                     return
 
@@ -284,6 +291,7 @@ class ListView(View):
             self.dirty = True
             return True
 
+        count = len(self.items)
         if key in (curses.KEY_UP, ord("k")):
             self.set_selected(self._selected - 1, visible_mode="top")
         elif key in (curses.KEY_DOWN, ord("j")):
@@ -301,15 +309,13 @@ class ListView(View):
             self.set_selected(max(0, self._selected - self.height))
         elif key in (curses.KEY_NPAGE, KEY_CTRL("f")):
             self._offset_y = min(
-                self._offset_y + self.height, max(0, len(self.items) - self.height)
-            )
-            self.set_selected(
-                min(self._selected + self.height, max(0, len(self.items) - 1))
+                self._offset_y + self.height, max(0, count - self.height)
             )
+            self.set_selected(min(self._selected + self.height, max(0, count - 1)))
         elif key in (curses.KEY_HOME, ord("g")):
             self.set_selected(0)
         elif key in (curses.KEY_END, ord("G")):
-            self.set_selected(max(0, len(self.items) - 1))
+            self.set_selected(max(0, count - 1))
         elif key == ord("/"):
             if self._search_dialog:
                 self._search_dialog.clear()
@@ -325,30 +331,77 @@ class ListView(View):
 
         return True
 
+    def _set_geometry(self, height, width, y, x):
+        if not super()._set_geometry(height, width, y, x):
+            return False
+        self._drawn_rows = []
+        return True
+
+    def screen_size_changed(self, lines, cols):
+        super().screen_size_changed(lines, cols)
+        self._drawn_rows = []
+
     def draw(self):
         separator_items = []
-        for i in range(0, min(self.height, len(self.items) - self._offset_y)):
-            idx = i + self._offset_y
-            item = self.items[idx]
-            selected = idx == self._selected
-            matched = (
-                self._search_dialog.matches(item) if self._search_dialog else False
-            )
+        # Hoist the per-frame constants out of the row loop: this runs for every
+        # visible row on every redraw, and each self.* is a dict lookup.
+        win = self.win
+        move = win.move
+        items = self.items
+        x, y = self.x, self.y
+        height, full_width = self.height, self.width
+        offset_x, offset_y = self._offset_x, self._offset_y
+        selected_idx = self._selected
+        matches = self._search_dialog.matches if self._search_dialog else None
+
+        # Rows are only comparable with last frame's when they were drawn at the
+        # same place, width, scroll column and dimming.
+        frame = (x, y, full_width, height, offset_x, Screen.dimmed)
+        if frame != self._drawn_frame or len(self._drawn_rows) != height:
+            self._drawn_frame = frame
+            self._drawn_rows = [None] * height
+        drawn_rows = self._drawn_rows
+
+        rows = max(0, min(height, len(items) - offset_y))
+        last_drawn = False
+        for i in range(0, rows):
+            idx = i + offset_y
+            item = items[idx]
+            selected = idx == selected_idx
+            matched = matches(item) if matches else False
+
+            key = None if item.is_separator else item.render_key()
+            if key is not None:
+                key = (item, key, selected, bool(matched))
+                if drawn_rows[i] == key:
+                    last_drawn = False
+                    continue
+            drawn_rows[i] = key
+            last_drawn = True
 
             # curses throws exception if you want to write a character in bottom left corner
-            width = self.width
-            if i == self.height - 1:
-                width -= 1
+            width = full_width - 1 if i == height - 1 else full_width
 
             if item.is_separator:
                 separator_items.append((i, width))
             else:
-                self.win.move(self.y + i, self.x)
-                item.draw_line(
-                    self.win, self._offset_x, width, selected, matched, False
-                )
-
-        self.win.clrtobot()
+                move(y + i, x)
+                item.draw_line(win, offset_x, width, selected, matched, False)
+
+        # Clear below the last row. Rows past the end of the list are blank, so
+        # their slots are forgotten; a skipped last row already sits on a clean
+        # tail from the frame that drew it. Position the cursor explicitly: a
+        # row may leave it mid-row (hline fills don't advance it).
+        for i in range(rows, height):
+            drawn_rows[i] = None
+        if rows < height:
+            move(y + rows, x)
+            win.clrtobot()
+        elif last_drawn:
+            # The last row stops one column short (bottom-right corner); clear
+            # the cell it leaves.
+            move(y + height - 1, x + self.width - 1)
+            win.clrtoeol()
         super().draw()
 
         if separator_items:
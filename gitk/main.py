@@ -10,6 +10,7 @@ import curses
 import curses.panel
 import subprocess
 import sys
+import time
 import traceback
 import typing
 
@@ -30,6 +31,12 @@ from gitk.screen import Screen
 from gitk.split_layout import SPLIT_OFF, SPLIT_SIDE, SPLIT_STACKED
 from gitk.views import ContextMenu, GitDiffView, GitLogView, GitRefsView
 
+# Minimum time between two frames drawn for key presses. A held key
+# auto-repeats faster than frames are worth drawing; presses that land within
+# this interval of the last frame are applied but drawn together, once the
+# keys stop or the interval has passed.
+KEY_REDRAW_INTERVAL = 0.016
+
 
 def launch_curses(stdscr, git_args: typing.List, cmd_args: typing.List):
 
@@ -73,6 +80,10 @@ def launch_curses(stdscr, git_args: typing.List, cmd_args: typing.List):
 
     try:
         user_input = True
+        # A key press whose frame was deferred by KEY_REDRAW_INTERVAL, and
+        # when the last frame was drawn.
+        redraw_pending = False
+        last_draw = 0.0
 
         while app.running:
             update_jobs = Job.process_all_jobs()
@@ -81,21 +92,34 @@ def launch_curses(stdscr, git_args: typing.List, cmd_args: typing.List):
             # bar while one is showing even if nothing else changed.
             flash = app.screen.flash_active()
 
-            if update_jobs or user_input or flash:
+            now = time.monotonic()
+            if (
+                user_input
+                and app.keyboard.key not in (curses.KEY_MOUSE, curses.KEY_RESIZE)
+                and now - last_draw < KEY_REDRAW_INTERVAL
+            ):
+                # Auto-repeat: fold this key into the next frame.
+                redraw_pending = True
+            elif update_jobs or user_input or flash or redraw_pending:
                 try:
                     # Draws dirty content, then composites the panel deck and the
-                    # bottom bar in one doupdate().
-                    app.screen.draw_visible_views()
+                    # bottom bar in one doupdate() (skipped on a job/flash tick
+                    # that changed nothing).
+                    app.screen.draw_visible_views(
+                        idle=not (user_input or redraw_pending)
+                    )
                 except curses.error as e:
                     app.log.warning(
                         f"Curses exception: {str(e)}\n{traceback.format_exc()}"
                     )
+                redraw_pending = False
+                last_draw = now
 
             active_view = app.screen.get_active_view()
             if not active_view:
                 break
 
-            stdscr.timeout(5 if update_jobs or flash else 100)
+            stdscr.timeout(5 if update_jobs or flash or redraw_pending else 100)
 
             user_input = app.keyboard.read(stdscr)
             if not user_input:
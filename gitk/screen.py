@@ -33,6 +33,11 @@ class Screen:
     # (show_working with dim=True) to signal "busy, input ignored"; the bottom
     # bar is exempt because it is painted with bar_color(), not color().
     dimmed = False
+    # color() results, keyed by its normalized arguments + tier + dimming. The
+    # cached attrs are pair numbers and video flags, not the pairs' colours, so
+    # they stay valid for the process; __init__ clears it anyway when it
+    # (re)picks the tier and re-inits the pairs.
+    _color_cache: typing.ClassVar[dict[tuple, int]] = {}
     # Background meaning "terminal default"; COLOR_BLACK if use_default_colors fails.
     _default_bg = -1
 
@@ -144,7 +149,28 @@ class Screen:
     ):
         """Colour pair for base palette index `number`, offset by selection
         state. `highlighted` is the generic emphasis-background slot: rows pass
-        their `marked` flag, toggle segments pass their `toggled` state."""
+        their `marked` flag, toggle segments pass their `toggled` state.
+
+        Called for every row and segment drawn, so the attribute is computed
+        once per distinct combination (including the colour tier and dimming)
+        and looked up afterwards."""
+        key = (
+            number,
+            bool(selected),
+            bool(highlighted),
+            bool(matched),
+            None if bold is None else bool(bold),
+            bool(dim),
+            cls.color_depth,
+            cls.dimmed,
+        )
+        attr = cls._color_cache.get(key)
+        if attr is None:
+            attr = cls._color_cache[key] = cls._color_attr(*key[:6])
+        return attr
+
+    @classmethod
+    def _color_attr(cls, number, selected, highlighted, matched, bold, dim):
         if matched:
             bold = True
             if number == Screen.C_NORMAL:
@@ -206,6 +232,7 @@ class Screen:
             except curses.error:
                 Screen._default_bg = curses.COLOR_BLACK
             Screen.color_depth = 256 if curses.COLORS >= 256 else 8
+        Screen._color_cache.clear()
 
         Screen._init_color(Screen.C_NORMAL, curses.COLOR_WHITE)
         Screen._init_color(Screen.C_ERROR, curses.COLOR_RED)
@@ -277,6 +304,9 @@ class Screen:
         # Set on terminal resize: every window changed, so clear the background and
         # re-touch every panel for a full recomposition next frame.
         self._full_redraw = False
+        # What the last composited frame showed (panel stack, bottom-bar state,
+        # terminal size) - lets an idle tick with nothing new skip the flush.
+        self._last_frame = None
 
         # Midnight-Commander-style function-key panel pinned to the bottom row.
         # Each entry is (key label, name, callback); callbacks reach the app's
@@ -304,6 +334,9 @@ class Screen:
         # Filled by draw_bottom_bar each frame: (x_start, x_end, callback) ranges
         # used to route clicks on the bottom row to the right entry.
         self.bar_hitmap = []
+        # The F-key bar laid out for a terminal width: (cols, cells, hit-map).
+        # Only a resize changes it, so it isn't rebuilt every frame.
+        self._bar_layout = None
 
         # Success "flash": for FLASH_DURATION seconds after a command succeeds the
         # whole bottom bar is replaced by this message on a green background, then
@@ -479,11 +512,11 @@ class Screen:
         y = lines - 1
 
         if self.working_message:
-            # cols - 1: the bottom-right cell raises addwstr() ERR (see below).
-            stdscr.addstr(
+            self._draw_bar_message(
+                stdscr,
                 y,
-                0,
-                self.working_message[: cols - 1].ljust(cols - 1),
+                cols,
+                self.working_message,
                 Screen.bar_color(Screen.BAR_WORK_PAIR) | curses.A_BOLD,
             )
             self.bar_hitmap = []  # the F-key cells are hidden, so swallow clicks
@@ -491,11 +524,11 @@ class Screen:
 
         if self.flash_message:
             if time.time() - self.flash_time < self.FLASH_DURATION:
-                # cols - 1: the bottom-right cell raises addwstr() ERR (see below).
-                stdscr.addstr(
+                self._draw_bar_message(
+                    stdscr,
                     y,
-                    0,
-                    self.flash_message[: cols - 1].ljust(cols - 1),
+                    cols,
+                    self.flash_message,
                     Screen.bar_color(Screen.BAR_FLASH_PAIR),
                 )
                 self.bar_hitmap = []  # the F-key cells are hidden, so swallow clicks
@@ -506,14 +539,37 @@ class Screen:
         label_attr = Screen.bar_color(
             Screen.BAR_LABEL_PAIR
         )  # black on cyan (reverse if monochrome)
+        if self._bar_layout is None or self._bar_layout[0] != cols:
+            self._bar_layout = (cols, *self._layout_bottom_bar(cols))
+        _, cells, hitmap = self._bar_layout
         # cols - 1: writing the bottom-right cell advances the cursor off-screen
-        # and raises addwstr() ERR.
-        stdscr.addstr(y, 0, " " * (cols - 1), num_attr)
-
+        # and raises addwstr() ERR. hline() doesn't move the cursor at all.
+        stdscr.hline(y, 0, ord(" ") | num_attr, cols - 1)
+        for x, num, label in cells:
+            stdscr.addstr(y, x, num, num_attr)
+            if label:
+                stdscr.addstr(y, x + len(num), label, label_attr)
+        self.bar_hitmap = hitmap
+
+    @staticmethod
+    def _draw_bar_message(stdscr, y, cols, message, attr):
+        """Fill the bottom row with `message` on a solid `attr` band. cols - 1:
+        the bottom-right cell raises addwstr() ERR (see draw_bottom_bar). The
+        band is finished with one hline() rather than a space-padded copy of
+        the message every frame."""
+        message = message[: cols - 1]
+        stdscr.addstr(y, 0, message, attr)
+        if len(message) < cols - 1:
+            stdscr.hline(ord(" ") | attr, cols - 1 - len(message))
+
+    def _layout_bottom_bar(self, cols):
+        """The F-key bar for a `cols`-wide terminal: the (x, key number, padded
+        label) cells and the click hit-map."""
         # Spread the entries evenly over the whole width: equal cells, with the
         # remainder handed to the leftmost cells. Each cell is a 2-wide key
         # number then the label padded out on cyan to fill the cell.
-        self.bar_hitmap = []
+        cells = []
+        hitmap = []
         entries = self.bottom_bar_entries
         total = cols - 1
         n = len(entries)
@@ -524,27 +580,42 @@ class Screen:
                 break
             num = (key[1:] if key.startswith("F") else key).rjust(2)  # ' 1', '10'
             label = name[: cell_w - len(num)].ljust(cell_w - len(num))
-            stdscr.addstr(y, x, num, num_attr)
-            if label:
-                stdscr.addstr(y, x + len(num), label, label_attr)
-            self.bar_hitmap.append((x, x + cell_w, callback))
+            cells.append((x, num, label))
+            hitmap.append((x, x + cell_w, callback))
             x += cell_w
+        return cells, hitmap
 
-    def draw_visible_views(self):
+    def draw_visible_views(self, idle=False):
         # Refresh only the content of windows whose content changed; the panel
         # deck handles occlusion and uncovered regions. On a full redraw (terminal
         # resize) clear the background and re-touch every panel so the whole stack
         # is recomposed. Then push the background (with the bottom bar), composite
         # the panels over it, and flush - all in a single doupdate().
+        #
+        # idle=True marks a tick driven only by a running job or a flash timer
+        # (no user input). Those run every few milliseconds while git streams, so
+        # when no window was redrawn and the panel stack and bottom bar are the
+        # same as last frame, skip the update_panels()/doupdate() pass entirely.
         force = self._full_redraw
         if force:
             self._full_redraw = False
             self.stdscr.clear()
 
+        drew = force
         for view in self.showed_views:
-            view.redraw(force)
+            if view.redraw(force):
+                drew = True
 
         self.draw_bottom_bar(self.stdscr)
+        frame = (
+            tuple(self.showed_views),
+            self.working_message,
+            self.flash_message,
+            self.stdscr.getmaxyx(),
+        )
+        if idle and not drew and frame == self._last_frame:
+            return
+        self._last_frame = frame
         self.stdscr.noutrefresh()
         curses.panel.update_panels()
         curses.doupdate()
@@ -24,6 +24,15 @@ from gitk.segments import ButtonSegment, FillerSegment, RefSegment, Segment, Tex
 
 
 class SegmentedListItem(Item):
+    __slots__ = (
+        "bg_color",
+        "clicked_segment",
+        "fill_char",
+        "fill_width",
+        "segment_separator",
+        "segments",
+    )
+
     def __init__(self, segments=[], bg_color=Screen.C_NORMAL):
         super().__init__()
         self.segment_separator = " "
@@ -122,7 +131,14 @@ class SegmentedListItem(Item):
     def draw_line(self, win, offset, width, selected, matched, marked):
         remaining_width = width
         bg_selected = self._bg_selected(selected)
+        # Per-row constants bound once, outside the segment loop: the row
+        # background attribute (separators, fillers, trailing fill), the
+        # separator and its width, and the bound methods called per segment.
+        bg_attr = Screen.color(self.bg_color, bg_selected, marked, matched)
+        addstr = win.addstr
+        segment_selected = self._segment_selected
         sep = self.segment_separator
+        sep_len = len(sep)
         prev_visible = False  # did the previous segment render any columns?
         for index, segment in enumerate(self.get_segments()):
             if index > 0 and sep:
@@ -133,29 +149,24 @@ class SegmentedListItem(Item):
                 # only after a segment that showed text — no separator after an
                 # empty/zero-width one). At offset 0 this reduces to the original
                 # "draw a separator before each segment that follows a visible one".
-                if offset >= len(sep):
-                    offset -= len(sep)
+                if offset >= sep_len:
+                    offset -= sep_len
                 else:
                     visible_sep = sep[offset:]
                     offset = 0
                     if prev_visible:
                         remaining_width -= len(visible_sep)
-                        win.addstr(
-                            visible_sep,
-                            Screen.color(self.bg_color, bg_selected, marked, matched),
-                        )
+                        addstr(visible_sep, bg_attr)
             if isinstance(segment, FillerSegment):
                 txt = self.get_fill_txt(width)
-                win.addstr(
-                    txt, Screen.color(self.bg_color, bg_selected, marked, matched)
-                )
+                addstr(txt, bg_attr)
                 length = len(txt)
             else:
                 length = segment.draw(
                     win,
                     offset,
                     remaining_width,
-                    self._segment_selected(index, selected),
+                    segment_selected(index, selected),
                     matched,
                     marked,
                 )
@@ -168,16 +179,11 @@ class SegmentedListItem(Item):
 
         if remaining_width > 0:
             if bg_selected or marked:
-                win.addstr(
-                    " " * remaining_width,
-                    Screen.color(self.bg_color, bg_selected, marked, matched),
-                )
+                # Band the rest of the row with one hline (no padding string).
+                win.hline(ord(" ") | bg_attr, remaining_width)
             elif self.fill_char != " ":
                 # rule-line bar: trail the title with its fill character ('─')
-                win.addstr(
-                    self.fill_char * remaining_width,
-                    Screen.color(self.bg_color, bg_selected, marked, matched),
-                )
+                addstr(self.fill_char * remaining_width, bg_attr)
             else:
                 win.clrtoeol()
 
@@ -355,16 +361,53 @@ class UncommittedChangesListItem(SegmentedListItem):
 
 
 class CommitListItem(SegmentedListItem):
+    # One per loaded commit: the log holds the whole history as these rows.
+    __slots__ = ("_row_commit", "_row_key", "_row_segments", "_row_text", "id")
+
     def __init__(self, id: str):
         super().__init__()
         self.id = id
+        # get_segments() runs several times per row per frame (drawing, filler
+        # width, hit-testing), and building a row formats the date and looks up
+        # its refs. Keep the last built row until one of its inputs changes.
+        self._row_commit = None
+        self._row_key = None
+        self._row_segments = None
+        self._row_text = None
 
     def get_row_context_menu(self):
         return (self, ID_GIT_LOG)
 
+    def get_text(self):
+        segments = self.get_segments()
+        if segments is not self._row_segments:
+            return super().get_text()
+        if self._row_text is None:
+            self._row_text = super().get_text()
+        return self._row_text
+
     def get_segments(self):
         app = self.get_app()
-        commit = app.git_log.commits.get(self.id)
+        git_log = app.git_log
+        commit = git_log.commits.get(self.id)
+        key = (
+            git_log.show_commit_id,
+            git_log.show_commit_date,
+            git_log.show_commit_author,
+            git_log.head_branch,
+            app.git_refs.refs_version,
+        )
+        if commit is not None and commit is self._row_commit and key == self._row_key:
+            return self._row_segments
+        segments = self._build_segments(app, commit)
+        if commit is not None:
+            self._row_commit = commit
+            self._row_key = key
+            self._row_segments = segments
+            self._row_text = None
+        return segments
+
+    def _build_segments(self, app, commit):
         if commit is None:
             # A stale row can outlive the reload that discarded its commit data
             # (a queued mouse event, a jump-list hop): degrade to the bare id
@@ -398,12 +441,20 @@ class CommitListItem(SegmentedListItem):
                 RefSegment(ref, app.git_log.head_branch),
             )
 
-        # These segments are rebuilt each call (not the wired self.segments), so
+        # These segments are built here (not the wired self.segments), so
         # back-wire them so they can reach the app via get_app() too.
         for segment in segments:
             segment._item = self
         return segments
 
+    def render_key(self):
+        # The cached segment list is rebuilt (a new list) whenever anything it
+        # shows changes; the only other input to the drawn row is the mark.
+        return (
+            self.get_segments(),
+            self.get_app().git_log.marked_commit_id == self.id,
+        )
+
     def draw_line(self, win, offset, width, selected, matched, marked):
         super().draw_line(
             win,
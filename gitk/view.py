@@ -162,7 +162,14 @@ class View:
         uncovers its full OLD footprint - then move to a valid origin, resize,
         move to the target, and restore it: to the top if it was the active view,
         otherwise back into stack order. The actual repaint is a single
-        update_panels()/doupdate() per frame, so the hide/show is invisible."""
+        update_panels()/doupdate() per frame, so the hide/show is invisible.
+
+        Re-placing a window where it already is (e.g. reopening a popup at
+        the same size) keeps the window and its content as they are. Returns
+        whether the geometry changed."""
+        if self.win.getmaxyx() == (height, width) and self.win.getbegyx() == (y, x):
+            self.dirty = True
+            return False
         was_top = self.is_active()
         shown = not self.panel.hidden()
         if shown:
@@ -177,6 +184,7 @@ class View:
             else:
                 self.app.screen._restack()
         self.dirty = True
+        return True
 
     def set_header_item(self, item):
         self.header_item = item
@@ -346,6 +354,7 @@ class View:
         # Draw content into the window buffer; the screen's update_panels() +
         # doupdate() pass composites it. force=True re-touches the whole window so
         # it is re-emitted even when its content is unchanged (used on full redraw).
+        # Returns whether anything was drawn.
         if self.dirty or force:
             self.dirty = False
             self.header_dirty = False
@@ -355,6 +364,9 @@ class View:
         elif self.header_dirty:
             self.header_dirty = False
             self.draw_header(self.split_border_sides())
+        else:
+            return False
+        return True
 
     def border_color(self):
         return Screen.color(Screen.C_DATA if self.is_active() else SPLIT_DIVIDER_COLOR)
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import array
+import bisect
+import collections
 import curses
 import re
 import typing
@@ -18,8 +21,8 @@ from gitk.diff_target import (
 from gitk.dialogs import SearchDialogPopup
 from gitk.ids import ID_GIT_DIFF, ID_GIT_DIFF_SEARCH
 from gitk.input import KeyboardState
-from gitk.items import DiffListItem
-from gitk.jobs import GitDiffJob
+from gitk.items import DiffListItem, FileHeaderListItem
+from gitk.jobs import GitDiffJob, Job
 from gitk.list_view import ListView, _raise_split_sibling
 from gitk.screen import Screen
 from gitk.segmented_items import WindowTopBarItem
@@ -30,6 +33,45 @@ from gitk.segments import (
     TextSegment,
 )
 
+# How many finished diffs GitDiffView keeps for instant revisits, and how many
+# rows they may hold in total: a few huge diffs must not pin memory that 32
+# ordinary ones would never use. A diff larger than the row budget on its own
+# is not kept at all.
+DIFF_CACHE_SIZE = 32
+DIFF_CACHE_ROWS = 200_000
+# How many blamed files GitDiffView remembers for jump-to-origin.
+ORIGIN_CACHE_SIZE = 16
+
+# One 'git blame -lsfn' output line: commit id, original path, original line,
+# then the (right-aligned) final line number and ')'. Whole-file blames pad
+# both numbers, so the path must stop before the padding.
+_BLAME_LINE = re.compile(r"(\^?[0-9a-f]{7,}) ([^)]+?) +([0-9]+) +([0-9]+)\) ")
+
+
+def _parse_blame(output: str) -> dict[int, tuple[str, str, int]]:
+    """{final line: (commit id, path, line) it came from} for 'git blame -lsfn'
+    `output`. Keyed on the final line number git prints rather than on output
+    line order: text-mode subprocess output turns a lone CR inside a line's
+    content into a line break, which would shift every later line. Boundary
+    ids keep their '^' prefix."""
+    origins = {}
+    for text in output.split("\n"):
+        # e.g. "a42cadebfe42d85cbf36f4887be166b34077b3e2 test test.txt 1 1) aaa"
+        match = _BLAME_LINE.match(text)
+        if match:
+            origins[int(match.group(4))] = (
+                match.group(1),
+                match.group(2),
+                int(match.group(3)),
+            )
+    return origins
+
+
+# Ctrl-n/Ctrl-p forward a plain Down/Up to the log pane. Handlers only read a
+# synthetic KeyboardState, so one shared instance each serves every press.
+_KEY_LOG_DOWN = KeyboardState(curses.KEY_DOWN)
+_KEY_LOG_UP = KeyboardState(curses.KEY_UP)
+
 
 class GitDiffView(ListView):
     def __init__(self, app):
@@ -51,6 +93,34 @@ class GitDiffView(ListView):
         # view_key -> (selected line, offset_y), so revisiting the same commit
         # or worktree diff restores where the user left it.
         self.position_map = {}
+        # (target, options) -> rows of a finished load, for cacheable targets
+        # (immutable commits/tags), so revisiting one skips re-running and
+        # re-parsing git. Least recently shown entries are evicted past
+        # DIFF_CACHE_SIZE entries or DIFF_CACHE_ROWS rows in total.
+        self._diff_cache = collections.OrderedDict()
+        self._diff_cache_rows = 0
+        # (blame revision, path) -> {line: (commit id, path, line) it came
+        # from} for the whole file, for blames against an immutable revision,
+        # so jumping to the origin of any line of a file blamed before skips
+        # 'git blame'. Least recently used files are evicted past
+        # ORIGIN_CACHE_SIZE.
+        self._origin_cache = collections.OrderedDict()
+        # File boundaries of the loaded diff, in row order: the row index of
+        # each "diff --git" header and the (post-rename) b/ path it introduces.
+        # Built as rows stream in, so jump-to-file need not regex-scan every
+        # row of a large diff.
+        self._file_starts: list[int] = []
+        self._file_paths: list[str] = []
+        # Rows matching the search query, ascending, for the matcher they were
+        # collected with and the first `_search_scanned` rows. Diff rows never
+        # change once shown, so n/N reuse these hits and only test rows that
+        # streamed in since, instead of re-testing every row from the cursor.
+        # Kept as a packed int array: a broad query on a huge diff can hit
+        # millions of rows, and a list would hold a full int object per hit.
+        self._search_matcher = None
+        self._search_key = None
+        self._search_scanned = 0
+        self._search_hits = array.array("i")
 
         self.set_header_item(
             WindowTopBarItem(
@@ -127,13 +197,65 @@ class GitDiffView(ListView):
         cleared/forgotten (e.g. after a context/whitespace reload)."""
         return self.target.view_key if self.target else ""
 
-    def blame_revision(self) -> typing.Optional[str]:
+    def blame_revision(self) -> str | None:
         """Git revision for the 'old' (---) side of the current diff, used as
         the blame base for jump-to-origin. Reads the *last* target shown, so
         it keeps working even after a reload made the view forget its
         identity."""
         return self._last_target.blame_revision() if self._last_target else None
 
+    def line_origin(self, path: str, line: int) -> tuple[str, str, int] | None:
+        """The (commit id, path, line) that introduced `line` of `path` on the
+        old side of the current diff, per 'git blame'; None if git can't tell."""
+        revision = self.blame_revision()
+        if not revision:
+            return None
+        if not self._last_target.cacheable:
+            # The base can move (e.g. HEAD): blame just this line, every time.
+            origins = self._blame(revision, path, line)
+            return origins.get(line) if origins else None
+
+        key = (revision, path)
+        origins = self._origin_cache.get(key)
+        if origins is None:
+            origins = self._blame(revision, path)
+            if origins is None:
+                return None
+            self._origin_cache[key] = origins
+            if len(self._origin_cache) > ORIGIN_CACHE_SIZE:
+                self._origin_cache.popitem(last=False)
+        else:
+            self._origin_cache.move_to_end(key)
+        return origins.get(line)
+
+    def _blame(
+        self, revision: str, path: str, line: int | None = None
+    ) -> dict[int, tuple[str, str, int]] | None:
+        """Blame `path` at `revision` - the whole file, or only `line` if
+        given - as {line: (commit id, path, line) it came from}. None if git
+        fails."""
+        args = ["git", "blame", "-lsfn"]
+        if line is not None:
+            args += ["-L", f"{line},{line}"]
+        result = Job.run_job(self.app, args + [revision, "--", path])
+        if result.returncode != 0:
+            return None
+
+        origins = _parse_blame(result.stdout)
+        boundary_ids = {}
+        for number, (id, file_path, file_line) in origins.items():
+            # A '^' prefix marks git blame's boundary (initial) commit; its id is
+            # one char short, so resolve it back to a full sha (once per id).
+            if id.startswith("^"):
+                if id not in boundary_ids:
+                    boundary_ids[id] = (
+                        Job.run_job(self.app, ["git", "rev-parse", id])
+                        .stdout.lstrip("^")
+                        .rstrip()
+                    )
+                origins[number] = (boundary_ids[id], file_path, file_line)
+        return origins
+
     def remember_position(self, view_key: str, line, offset_y):
         """Seed/overwrite the saved scroll position for `view_key` (used by
         the jump list to pre-seed a target before triggering its load)."""
@@ -154,12 +276,118 @@ class GitDiffView(ListView):
             if entry:
                 line, offset_y = entry
                 on_finished = partial(self.restore_view_position, line, offset_y)
-        self.job.start_job(target.git_args(self._diff_options()), on_finished)
+        options = self._diff_options()
+        cache_key = (target, options) if target.cacheable else None
+        items = self._diff_cache.get(cache_key) if cache_key else None
+        if items is not None:
+            # Already loaded once: show the parsed rows without running git.
+            self._diff_cache.move_to_end(cache_key)
+            self.job.stop_job()
+            self.items = list(items)
+            for row, item in enumerate(self.items):
+                self._index_file_header(row, item)
+            if on_finished is not None:
+                on_finished()
+            return
+        if cache_key:
+            on_finished = partial(self._diff_loaded, cache_key, on_finished)
+        self.job.start_job(target.git_args(options), on_finished)
+
+    def _diff_loaded(self, cache_key, on_finished=None):
+        # An empty result is a failed load (e.g. a bad revision): don't keep it.
+        if self.items and len(self.items) <= DIFF_CACHE_ROWS:
+            replaced = self._diff_cache.pop(cache_key, None)
+            if replaced is not None:
+                self._diff_cache_rows -= len(replaced)
+            self._diff_cache[cache_key] = list(self.items)
+            self._diff_cache_rows += len(self.items)
+            while (
+                len(self._diff_cache) > DIFF_CACHE_SIZE
+                or self._diff_cache_rows > DIFF_CACHE_ROWS
+            ):
+                _, evicted = self._diff_cache.popitem(last=False)
+                self._diff_cache_rows -= len(evicted)
+        if on_finished is not None:
+            on_finished()
+
+    def append(self, item):
+        self._index_file_header(len(self.items), item)
+        super().append(item)
 
     def clear(self):
         self.target = None
+        self._file_starts = []
+        self._file_paths = []
+        self._search_matcher = None
         super().clear()
 
+    def _index_file_header(self, row: int, item):
+        if isinstance(item, FileHeaderListItem):
+            self._file_starts.append(row)
+            self._file_paths.append(item.file_path)
+
+    def _search_hit_rows(self) -> array.array:
+        dialog = self._search_dialog
+        matcher = dialog.text_matcher()
+        items = self.items
+        if matcher is not self._search_matcher:
+            key = dialog.query_key()
+            if self._search_matcher is not None and dialog.narrows(
+                self._search_key, key
+            ):
+                # A refined query (e.g. the old text typed further) can only hit
+                # rows the old one hit: re-test just those among the rows
+                # already scanned.
+                self._search_hits = array.array(
+                    "i", [i for i in self._search_hits if matcher(items[i].get_text())]
+                )
+            else:
+                self._search_scanned = 0
+                self._search_hits = array.array("i")
+            self._search_matcher = matcher
+            self._search_key = key
+        start = self._search_scanned
+        if start < len(items):
+            # One pass over the new rows: the matcher is a C-level str/regex
+            # call, so the per-row cost is the loop itself.
+            self._search_hits.extend(
+                [
+                    i
+                    for i, item in enumerate(items[start:], start)
+                    if matcher(item.get_text())
+                ]
+            )
+            self._search_scanned = len(items)
+        return self._search_hits
+
+    def search(self, backward: bool = False, repeat: bool = False):
+        if not self._search_dialog:
+            return
+        hits = self._search_hit_rows()
+        if not hits:
+            return
+        # The hits are ascending: find the neighbours of the cursor by bisection.
+        if not backward:
+            k = bisect.bisect_right(hits, self._selected)
+            if k < len(hits):
+                self.set_selected(hits[k])
+            elif repeat:
+                self.set_selected(hits[0])  # wrap around to the first hit
+        else:
+            k = bisect.bisect_left(hits, self._selected)
+            if k > 0:
+                self.set_selected(hits[k - 1])
+            elif repeat:
+                self.set_selected(hits[-1])  # wrap around to the last hit
+
+    def file_header_row(self, path: str) -> int | None:
+        """Row of the first "diff --git" header for `path`, or None if the
+        loaded diff has no (unquoted) header for it."""
+        try:
+            return self._file_starts[self._file_paths.index(path)]
+        except ValueError:
+            return None
+
     def show(self):
         _raise_split_sibling(self, self.app.git_log)
         super().show()
@@ -192,18 +420,26 @@ class GitDiffView(ListView):
                 )
 
     def select_line(self, file: str, line: int):
-        match = next(
-            (
-                item
-                for item in self.items
-                if isinstance(item, DiffListItem)
-                and item.new_file_path == file
-                and item.new_file_line == line
-            ),
-            None,
-        )
-        if match is not None:
-            self.set_selected(match.line)
+        # Only the rows of `file`'s sections can hold its lines: scan those
+        # first, by the file-boundary index, rather than walking the whole
+        # diff. A merge ('git show -m') has one section per parent, so try each;
+        # fall back to every row if none has it (e.g. an unindexed header).
+        items = self.items
+        starts = self._file_starts
+        sections = [
+            items[starts[k] : starts[k + 1] if k + 1 < len(starts) else None]
+            for k, path in enumerate(self._file_paths)
+            if path == file
+        ]
+        for rows in (*sections, items):
+            for item in rows:
+                if (
+                    isinstance(item, DiffListItem)
+                    and item.new_file_path == file
+                    and item.new_file_line == line
+                ):
+                    self.set_selected(item.line)
+                    return
 
     def _reload_diff(self):
         """Re-run the last shown target with fresh options (context size,
@@ -237,9 +473,9 @@ class GitDiffView(ListView):
         elif key == ord("-"):
             self.change_context(-1)
         elif key == KEY_CTRL("n"):
-            self.app.git_log.handle_input(KeyboardState(curses.KEY_DOWN))
+            self.app.git_log.handle_input(_KEY_LOG_DOWN)
         elif key == KEY_CTRL("p"):
-            self.app.git_log.handle_input(KeyboardState(curses.KEY_UP))
+            self.app.git_log.handle_input(_KEY_LOG_UP)
         elif key in (ord("g"), ord("G"), curses.KEY_HOME, curses.KEY_END):
             track = self._tracks_position()
             if track:
@@ -15,6 +15,9 @@ class GitRefsView(ListView):
         super().__init__(app, ID_GIT_REFS)
 
         self.refs = {}  # map: git_id --> [ { 'type':<ref-type>, 'name':<ref-name> } ]
+        # Bumped on every change to self.refs, so rows that render refs can
+        # cache what they built and notice when it went stale.
+        self.refs_version = 0
 
         self.set_header_item(
             WindowTopBarItem("Git references", title_color=Screen.C_DATA)
@@ -23,6 +23,7 @@ import struct
 import sys
 import termios
 import time
+import typing
 
 import pyte
 
@@ -41,6 +42,36 @@ def _set_winsize(fd, rows, cols):
     fcntl.ioctl(fd, termios.TIOCSWINSZ, struct.pack("HHHH", rows, cols, 0, 0))
 
 
+class _Screen(pyte.Screen):
+    """pyte.Screen plus SU/SD (CSI n S / CSI n T). Stock pyte ignores them, but
+    curses' scroll optimisation emits them (terminfo indn/rin) to shift the
+    scroll region by several lines at once, e.g. when a list jumps a page."""
+
+    def scroll_up(self, count=None, private=False):
+        _top, bottom = self.margins or pyte.screens.Margins(0, self.lines - 1)
+        y = self.cursor.y
+        self.cursor.y = bottom
+        for _ in range(count or 1):
+            self.index()
+        self.cursor.y = y
+
+    def scroll_down(self, count=None, private=False):
+        top, _bottom = self.margins or pyte.screens.Margins(0, self.lines - 1)
+        y = self.cursor.y
+        self.cursor.y = top
+        for _ in range(count or 1):
+            self.reverse_index()
+        self.cursor.y = y
+
+
+class _Stream(pyte.Stream):
+    csi: typing.ClassVar[dict] = {
+        **pyte.Stream.csi,
+        "S": "scroll_up",
+        "T": "scroll_down",
+    }
+
+
 _NAMED = {
     "black": 0,
     "red": 1,
@@ -99,14 +130,14 @@ class Harness:
         self._alive = False
         self._status = None
 
-        self.screen = pyte.Screen(cols, rows)
+        self.screen = _Screen(cols, rows)
         # Decode UTF-8 ourselves (incrementally, so multi-byte chars split across
         # reads survive) and feed a text Stream with use_utf8=False. That keeps
         # pyte's DEC-special-graphics charset mapping active -- curses draws popup
         # borders with the alternate charset (ESC(0 q -> "─"), which a ByteStream
         # in UTF-8 mode would render as raw letters.
         self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
-        self.stream = pyte.Stream(self.screen)
+        self.stream = _Stream(self.screen)
         self.stream.use_utf8 = False
         # Raw output bytes kept so --live can replay them verbatim to the real
         # terminal -- they carry the actual SGR colours and the alt-screen /
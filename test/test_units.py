@@ -41,6 +41,8 @@ from gitk.screen import Screen
 from gitk.segments import TextSegment
 from gitk.segmented_items import SegmentedListItem
 from gitk.items import UserInputListItem
+from gitk.jobs import GitDiffJob
+from gitk.views.git_diff import _parse_blame
 
 
 # --- Screen._to_pal colour-tier degradation ----------------------------------
@@ -136,3 +138,54 @@ def test_get_segment_on_offset_separator_column_hits_no_segment():
     hit = it.get_segment_on_offset(2)
     assert hit is not a and hit is not b  # the gap maps to a fresh empty Segment
     assert hit.get_text() == ""
+
+
+# --- _parse_blame (jump-to-origin line keys) ----------------------------------
+# Golden-impossible: a wrong key only sends jump-to-origin to the wrong commit
+# for some lines of some files, which no fixture screen exercises. Lines must be
+# keyed on git's final line number, not on output order: text-mode subprocess
+# output has already turned a lone CR inside a line into a line break.
+
+
+def test_parse_blame_keys_on_final_line_number_across_a_cr_line():
+    sha = "a42cadebfe42d85cbf36f4887be166b34077b3e2"
+    output = (
+        f"^{sha[:-1]} f.txt 1 1) one\n"
+        f"^{sha[:-1]} f.txt 2 2) two\n"
+        "X\n"  # the rest of line 2, split off at its CR
+        f"{sha} f.txt 3 3) three\n"
+        f"{sha} old name.txt 9 4) FOUR\n"
+    )
+    origins = _parse_blame(output)
+    assert sorted(origins) == [1, 2, 3, 4]
+    assert origins[4] == (sha, "old name.txt", 9)
+    assert origins[1] == (f"^{sha[:-1]}", "f.txt", 1)  # boundary id kept as is
+
+
+def test_parse_blame_strips_whole_file_number_padding():
+    sha = "a42cadebfe42d85cbf36f4887be166b34077b3e2"
+    origins = _parse_blame(f"{sha} a b.txt   7  12) x\n")
+    assert origins == {12: (sha, "a b.txt", 7)}
+
+
+# --- GitDiffJob._file_header_path (jump-to-file index) ------------------------
+# Golden-impossible: the fixture repo has no file whose name contains " b/", and
+# a wrong split only shows up as jump-to-file landing on the wrong section.
+
+
+def test_file_header_path_takes_the_b_side():
+    assert GitDiffJob._file_header_path("diff --git a/f.txt b/f.txt") == "f.txt"
+    assert GitDiffJob._file_header_path("diff --git a/old b/dir/new") == "dir/new"
+
+
+def test_file_header_path_splits_a_name_containing_b_slash_only_when_unambiguous():
+    # Equal halves: the split point is known even though " b/" recurs.
+    assert GitDiffJob._file_header_path("diff --git a/x b/y b/x b/y") == "x b/y"
+    # A rename with several " b/": no split is trusted.
+    assert GitDiffJob._file_header_path("diff --git a/x b/y b/z") is None
+
+
+def test_file_header_path_ignores_quoted_and_combined_headers():
+    assert GitDiffJob._file_header_path('diff --git "a/t\\t" "b/t\\t"') is None
+    assert GitDiffJob._file_header_path("diff --cc f.txt") is None
+